@@ -83,7 +83,12 @@ class CompilerError(Exception):
 
 class CompilerPool:
 
-    def __init__(self, maxWorkers=5):
+    def __init__(self, maxWorkers=None):
+        if maxWorkers is None:
+            # The workers are long-lived processes, so the import cost is only
+            # paid once per worker. We want enough of them to compile many
+            # fonts in parallel, but not more than we have cores.
+            maxWorkers = min(os.cpu_count() or 5, 16)
         self.loop = asyncio.get_running_loop()
         self.maxWorkers = maxWorkers
         self.workers = []
@@ -116,6 +121,8 @@ class CompilerWorker:
 
     async def start(self):
         env = dict(PYTHONPATH=":".join(sys.path), PYTHONHOME=sys.prefix)
+        # Pass on our own settings, such as FONTGOGGLES_CACHE_DIR
+        env.update((k, v) for k, v in os.environ.items() if k.startswith("FONTGOGGLES_"))
         args = ["-u", "-m", "fontgoggles.compile.workServer"]
         self.process = await asyncio.create_subprocess_exec(
             sys.executable, *args,
@@ -1,21 +1,37 @@
 """ Tools to compile a UFO's features as quickly as possible."""
 
+from collections import namedtuple
+import hashlib
+from html import unescape as unescapeXML
 import logging
+import os
 import pickle
 import re
+import shutil
 import sys
+import tempfile
 import traceback
 from types import SimpleNamespace
-import xml.etree.ElementTree as ET
+from xml.parsers.expat import ParserCreate
+from fs.errors import NoSysPath
+import fontTools
 from fontTools.feaLib.error import FeatureLibError
 from fontTools.fontBuilder import FontBuilder
-from fontTools.ttLib import newTable
-from fontTools.ufoLib import UFOReader
-from fontTools.ufoLib.glifLib import _BaseParser as BaseGlifParser
+from fontTools.ttLib import TTFont, newTable
+from fontTools.ufoLib import UFOReader, UFOFileStructure
+from fontTools.ufoLib import (METAINFO_FILENAME, FONTINFO_FILENAME, GROUPS_FILENAME, KERNING_FILENAME,
+                              FEATURES_FILENAME, LIB_FILENAME)
+import ufo2ft
 from ufo2ft.featureCompiler import FeatureCompiler
+from .. import __version__ as fontGogglesVersion
+try:
+    from ..misc import _glifscan
+except ImportError:
+    # It's ok to not have the compiled scanner, we'll use regexes instead.
+    _glifscan = None
 
 
-def compileUFOToFont(ufoPath):
+def compileUFOToFont(ufoPath, reader=None, glyphSet=None):
     """Compile the source UFO to a TTF with the smallest amount of tables
     needed to let HarfBuzz do its work. That would be 'cmap', 'post' and
     whatever OTL tables are needed for the features. Return the compiled
@@ -25,28 +41,40 @@ def compileUFOToFont(ufoPath):
     elsewhere, too), but having a picklable argument and return value
     allows us to run it in a separate process, enabling parallelism.
     """
-    reader = UFOReader(ufoPath, validate=False)
+    if reader is None:
+        reader = UFOReader(ufoPath, validate=False)
     ufo2 = reader.formatVersionTuple[0] < 3
-    glyphSet = reader.getGlyphSet()
+    if glyphSet is None:
+        glyphSet = reader.getGlyphSet()
     info = SimpleNamespace()
     reader.readInfo(info)
 
-    glyphOrder = sorted(glyphSet.keys())  # no need for the "real" glyph order
+    glyphNames = sorted(glyphSet.keys())  # no need for the "real" glyph order
+    glyphOrder = list(glyphNames)
     if ".notdef" not in glyphOrder:
         # We need a .notdef glyph, so let's make one.
         glyphOrder.insert(0, ".notdef")
-    cmap, revCmap, anchors = fetchCharacterMappingAndAnchors(glyphSet, ufoPath, ufo2=ufo2)
+    cmap, revCmap, anchors, duplicateUnicodes = _fetchCharacterMappingAndAnchors(glyphSet, glyphNames, ufo2)
+    if duplicateUnicodes:
+        _warnDuplicateUnicodes(ufoPath, duplicateUnicodes)
     fb = FontBuilder(round(info.unitsPerEm))
     fb.setupGlyphOrder(glyphOrder)
     fb.setupCharacterMap(cmap)
     fb.setupPost()  # This makes sure we store the glyph names
     ttFont = fb.font
-    # Store anchors in the font as a private table: this is valuable
-    # data that our parent process can use to do faster reloading upon
-    # changes.
+    # Store unicodes and anchors in the font as private tables: this is
+    # valuable data that our parent process can use to do faster reloading
+    # upon changes, without scanning the .glif files again.
+    ttFont["FGUx"] = newTable("FGUx")
+    ttFont["FGUx"].data = pickle.dumps(revCmap)
     ttFont["FGAx"] = newTable("FGAx")
     ttFont["FGAx"].data = pickle.dumps(anchors)
-    ufo = MinimalFontObject(ufoPath, reader, revCmap, anchors)
+    if duplicateUnicodes:
+        # Keep these, so compileUFOToPath() can repeat the warning when the
+        # font comes from the cache.
+        ttFont["FGDx"] = newTable("FGDx")
+        ttFont["FGDx"].data = pickle.dumps(duplicateUnicodes)
+    ufo = MinimalFontObject(ufoPath, reader, revCmap, anchors, glyphSet)
     feaComp = FeatureCompiler(ufo, ttFont)
     try:
         feaComp.compile()
@@ -62,18 +90,187 @@ def compileUFOToFont(ufoPath):
 
 
 def compileUFOToPath(ufoPath, ttPath):
-    ttFont, error = compileUFOToFont(ufoPath)
+    """Compile the source UFO to a TTF and write it to ttPath. The compiled
+    font is cached on disk, so compiling an unchanged UFO again is cheap.
+    """
+    reader = UFOReader(ufoPath, validate=False)
+    # Reading contents.plist is relatively expensive, so only do it once
+    glyphSet = reader.getGlyphSet()
+    cachePath = _getCachePath(reader, glyphSet)
+    if cachePath is not None and _readCache(ufoPath, cachePath, ttPath):
+        return
+    ttFont, error = compileUFOToFont(ufoPath, reader, glyphSet)
     if error:
         print(error, file=sys.stderr)
     ttFont.save(ttPath, reorderTables=False)
+    if error is None and cachePath is not None:
+        _writeCache(ttPath, cachePath)
 
 
-_unicodeOrAnchorGLIFPattern = re.compile(rb'(<\s*(anchor|unicode)\s+([^>]+)>)')
-_ufo2AnchorPattern = re.compile(rb"<contour>\s+(<point\s+[^>]+move[^>]+name[^>]+>)\s+</contour>")
-_unicodeAttributeGLIFPattern = re.compile(rb'hex\s*=\s*\"([0-9A-Fa-f]+)\"')
+def getUnicodesAndAnchors(ttFont):
+    """Return the unicodes and anchors that compileUFOToFont() stored in
+    the compiled font, as {glyphName: [codePoint, ...]} and
+    {glyphName: [(anchorName, x, y), ...]} dicts.
+    """
+    unicodes = pickle.loads(ttFont["FGUx"].data)
+    anchors = pickle.loads(ttFont["FGAx"].data)
+    return unicodes, anchors
+
+
+# The compiled font cache folder can be set with this environment variable.
+# Setting it to an empty string disables the cache.
+CACHE_DIR_ENV_VAR = "FONTGOGGLES_CACHE_DIR"
+_defaultCacheDir = os.path.join(os.path.expanduser("~"), ".cache", "fontgoggles")
+_maxCacheSize = 256 * 1024 * 1024  # total bytes
+_maxCacheFiles = 200
+_cachedUFOFiles = [METAINFO_FILENAME, FONTINFO_FILENAME, GROUPS_FILENAME, KERNING_FILENAME,
+                   FEATURES_FILENAME, LIB_FILENAME]
+_feaIncludePattern = re.compile(rb"include\s*\(")
+
+
+_codeFingerprint = None
+
+
+def _getCodeFingerprint():
+    # fontgoggles.__version__ doesn't change while working on a source
+    # checkout or an editable install, so the cache is also keyed on the
+    # code that produces the fonts.
+    global _codeFingerprint
+    if _codeFingerprint is None:
+        codePaths = [__file__]
+        if _glifscan is not None:
+            codePaths.append(_glifscan.__file__)
+        fingerprint = hashlib.blake2b(digest_size=20)
+        for codePath in codePaths:
+            with open(codePath, "rb") as f:
+                fingerprint.update(f.read())
+        _codeFingerprint = fingerprint.digest()
+    return _codeFingerprint
+
+
+def _getCacheDir():
+    cacheDir = os.environ.get(CACHE_DIR_ENV_VAR)
+    if cacheDir is None:
+        return _defaultCacheDir
+    return cacheDir or None
+
+
+def _getCachePath(reader, glyphSet):
+    """Return the path for the cached compiled font for the UFO, based on
+    a fingerprint of the compiler code, of the font-level data and of the
+    modification times and sizes of the .glif files. Return None if the UFO can't be cached, or if
+    caching is disabled.
+    """
+    cacheDir = _getCacheDir()
+    if cacheDir is None:
+        return None
+    if reader.fileStructure != UFOFileStructure.PACKAGE:
+        # We don't cache .ufoz
+        return None
+    fingerprint = hashlib.blake2b(digest_size=20)
+    versionInfo = (fontGogglesVersion, fontTools.version, ufo2ft.__version__)
+    fingerprint.update(repr(versionInfo).encode("utf-8"))
+    fingerprint.update(_getCodeFingerprint())
+    for fileName in _cachedUFOFiles:
+        data = reader.readBytesFromPath(fileName)
+        if fileName == FEATURES_FILENAME and data is not None and _feaIncludePattern.search(data):
+            # We don't track changes in included feature files
+            return None
+        if data is None:
+            data = b""
+            dataLength = -1  # distinguish a missing file from an empty one
+        else:
+            dataLength = len(data)
+        fingerprint.update(f"{fileName}:{dataLength}:".encode("utf-8"))
+        fingerprint.update(data)
+    with os.scandir(glyphSet.fs.getsyspath("/")) as entries:
+        glyphFiles = sorted((entry.name, entry.stat().st_size, entry.stat().st_mtime_ns) for entry in entries)
+    fingerprint.update(repr(glyphFiles).encode("utf-8"))
+    return os.path.join(cacheDir, fingerprint.hexdigest() + ".ttf")
+
+
+def _readCache(ufoPath, cachePath, ttPath):
+    """Copy the cached font to ttPath. Return False if it isn't in the cache."""
+    try:
+        shutil.copyfile(cachePath, ttPath)
+    except FileNotFoundError:
+        return False
+    try:
+        # Mark the cache file as recently used, see _pruneCache()
+        os.utime(cachePath)
+    except OSError:
+        pass
+    ttFont = TTFont(ttPath, lazy=True)
+    if "FGDx" in ttFont:
+        _warnDuplicateUnicodes(ufoPath, pickle.loads(ttFont["FGDx"].data))
+    ttFont.close()
+    return True
+
+
+def _writeCache(ttPath, cachePath):
+    cacheDir = os.path.dirname(cachePath)
+    tempPath = None
+    try:
+        os.makedirs(cacheDir, exist_ok=True)
+        # Copy to a temp file first, as another process may be reading the
+        # same cache file.
+        with tempfile.NamedTemporaryFile(dir=cacheDir, suffix=".tmp", delete=False) as f:
+            tempPath = f.name
+            with open(ttPath, "rb") as src:
+                shutil.copyfileobj(src, f)
+        os.replace(tempPath, cachePath)
+        tempPath = None
+        _pruneCache(cacheDir)
+    except OSError as e:
+        print(f"Could not write font cache: {e!r}", file=sys.stderr)
+    finally:
+        if tempPath is not None:
+            try:
+                os.unlink(tempPath)
+            except OSError:
+                pass
+
+
+def _pruneCache(cacheDir):
+    # Remove the least recently used files, so the cache doesn't grow
+    # without bound while fonts are being edited: every saved .glif file
+    # results in a new cache entry.
+    cacheFiles = []
+    with os.scandir(cacheDir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".ttf"):
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue  # removed by another process
+                cacheFiles.append((st.st_mtime, st.st_size, entry.path))
+    cacheFiles.sort(reverse=True)
+    totalSize = 0
+    for index, (modTime, size, path) in enumerate(cacheFiles):
+        totalSize += size
+        if index < _maxCacheFiles and totalSize <= _maxCacheSize:
+            continue
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+# XML does not allow whitespace between '<' and the element name
+_glifAttrsPattern = re.compile(rb'<(?P<tag>anchor|unicode)\b(?P<attrs>[^>]*)>')
+_attrPattern = re.compile(rb'(\w+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+_commentPattern = re.compile(rb"<!--(.*?)-->", re.DOTALL)
+_ufo2AnchorPattern = re.compile(rb"<contour>\s+<point\s+([^>]+move[^>]+name[^>]+)>\s+</contour>")
 
 
 def fetchCharacterMappingAndAnchors(glyphSet, ufoPath, glyphNames=None, ufo2=False):
+    cmap, revCmap, anchors, duplicateUnicodes = _fetchCharacterMappingAndAnchors(glyphSet, glyphNames, ufo2)
+    if duplicateUnicodes:
+        _warnDuplicateUnicodes(ufoPath, duplicateUnicodes)
+    return cmap, revCmap, anchors
+
+
+def _fetchCharacterMappingAndAnchors(glyphSet, glyphNames=None, ufo2=False):
     # This seems about 2.3 times faster than reader.getCharacterMapping()
     cmap = {}  # unicode: glyphName
     revCmap = {}
@@ -81,67 +278,134 @@ def fetchCharacterMappingAndAnchors(glyphSet, ufoPath, glyphNames=None, ufo2=Fal
     duplicateUnicodes = {}
     if glyphNames is None:
         glyphNames = sorted(glyphSet.keys())
+
+    readGLIF = _getGLIFReader(glyphSet)
+
+    # The scan holds the GIL, so doing this in multiple threads is slower
     for glyphName in glyphNames:
-        data = glyphSet.getGLIF(glyphName)
-        if b"<!--" in data:
-            # Fall back to proper parser, assuming this to be uncommon
-            # (This does not work for UFO 2)
-            unicodes, glyphAnchors = fetchUnicodesAndAnchors(data)
-        else:
-            # Fast route with regex
-            unicodes = []
-            glyphAnchors = []
-            for rawElement, tag, rawAttributes in _unicodeOrAnchorGLIFPattern.findall(data):
-                if tag == b"unicode":
-                    m = _unicodeAttributeGLIFPattern.match(rawAttributes)
-                    try:
-                        unicodes.append(int(m.group(1), 16))
-                    except ValueError:
-                        pass
-                elif tag == b"anchor":
-                    root = ET.fromstring(rawElement)
-                    glyphAnchors.append(_parseAnchorAttrs(root.attrib))
-            if ufo2:
-                for rawElement in _ufo2AnchorPattern.findall(data):
-                    root = ET.fromstring(rawElement)
-                    glyphAnchors.append(_parseAnchorAttrs(root.attrib))
-
-        uniqueUnicodes = []
-        for codePoint in unicodes:
-            if codePoint not in cmap:
+        unicodes, glyphAnchors = _scanGlif(readGLIF(glyphName), ufo2)
+        if unicodes:
+            # A dict rather than a set, as the order of the unicodes matters
+            uniqueUnicodes = dict.fromkeys(unicodes)
+            if not cmap.keys().isdisjoint(uniqueUnicodes):
+                for codePoint in uniqueUnicodes.keys() & cmap.keys():
+                    if codePoint in duplicateUnicodes:
+                        duplicateUnicodes[codePoint].append(glyphName)
+                    else:
+                        duplicateUnicodes[codePoint] = [cmap[codePoint], glyphName]
+                    del uniqueUnicodes[codePoint]
+            for codePoint in uniqueUnicodes:
                 cmap[codePoint] = glyphName
-                uniqueUnicodes.append(codePoint)
-            else:
-                if codePoint in duplicateUnicodes:
-                    duplicateUnicodes[codePoint].append(glyphName)
-                else:
-                    duplicateUnicodes[codePoint] = [cmap[codePoint], glyphName]
+            if uniqueUnicodes:
+                revCmap[glyphName] = list(uniqueUnicodes)
         if glyphAnchors:
             anchors[glyphName] = glyphAnchors
-        if uniqueUnicodes:
-            revCmap[glyphName] = uniqueUnicodes
 
-    if duplicateUnicodes:
-        dupMessage = "; ".join(f"U+{codePoint:04X}:{','.join(glyphNames)}"
-                               for codePoint, glyphNames in sorted(duplicateUnicodes.items()))
-        logger = logging.getLogger("fontgoggles.font.ufoFont")
-        logger.warning("Some code points in '%s' are assigned to multiple glyphs: %s",
-                       ufoPath, dupMessage)
-    return cmap, revCmap, anchors
+    return cmap, revCmap, anchors, duplicateUnicodes
+
+
+def _warnDuplicateUnicodes(ufoPath, duplicateUnicodes):
+    dupMessage = "; ".join(f"U+{codePoint:04X}:{','.join(glyphNames)}"
+                           for codePoint, glyphNames in sorted(duplicateUnicodes.items()))
+    logger = logging.getLogger("fontgoggles.font.ufoFont")
+    logger.warning("Some code points in '%s' are assigned to multiple glyphs: %s",
+                   ufoPath, dupMessage)
+
+
+def _getGLIFReader(glyphSet):
+    """Return a function that returns the GLIF data for a glyph name. If the
+    glyph set lives on the file system, read the files directly, as going
+    through the fs layer is many times slower. Reading ahead with a thread
+    pool was slower still, also with a cold disk cache.
+    """
+    try:
+        folder = glyphSet.fs.getsyspath("/")
+    except NoSysPath:
+        return glyphSet.getGLIF
+    contents = glyphSet.contents
+
+    def readGLIF(glyphName):
+        with open(os.path.join(folder, contents[glyphName]), "rb") as f:
+            return f.read()
+
+    return readGLIF
+
+
+def _scanGlif(data, ufo2=False):
+    """Return a list of unicodes and a list of (anchorName, x, y) tuples
+    for the GLIF data.
+    """
+    if not ufo2 and b"<unicode" not in data and b"<anchor" not in data:
+        # Most glyphs have neither unicodes nor anchors, and these substring
+        # searches are a lot cheaper than any of the scanners below.
+        return [], []
+    if b"<!--" in data and _hasCommentedOutElements(data, ufo2):
+        # Fall back to proper parser, assuming this to be uncommon
+        # (This does not work for UFO 2)
+        return fetchUnicodesAndAnchors(data)
+    if not ufo2 and b"&#" in data:
+        # Leave character references to the XML parser
+        return fetchUnicodesAndAnchors(data)
+    if _glifscan is not None and not ufo2:
+        # Fastest route with the compiled scanner
+        result = _glifscan.scan(data)
+        if result is not None:
+            unicodes, rawAnchors = result
+            return unicodes, [(name, _parseNumber(x), _parseNumber(y)) for name, x, y in rawAnchors]
+    # Fast route with regex
+    unicodes = []
+    glyphAnchors = []
+    for m in _glifAttrsPattern.finditer(data):
+        attrs = _parseGLIFAttributes(m.group("attrs"))
+        if m.group("tag") == b"unicode":
+            value = attrs.get("hex")
+            if value is not None:
+                try:
+                    unicodes.append(int(value, 16))
+                except ValueError:
+                    pass
+        else:
+            glyphAnchors.append(_parseAnchorAttrs(attrs))
+    if ufo2:
+        for rawAttributes in _ufo2AnchorPattern.findall(data):
+            glyphAnchors.append(_parseAnchorAttrs(_parseGLIFAttributes(rawAttributes)))
+    return unicodes, glyphAnchors
+
+
+def _hasCommentedOutElements(data, ufo2=False):
+    # Comments only confuse the fast routes if they contain elements we're
+    # scanning for, so a plain comment doesn't need the slow parser.
+    for comment in _commentPattern.findall(data):
+        if b"<unicode" in comment or b"<anchor" in comment or (ufo2 and b"<point" in comment):
+            return True
+    return False
+
+
+def _parseGLIFAttributes(rawAttributes):
+    attrs = {}
+    for name, doubleQuotedValue, singleQuotedValue in _attrPattern.findall(rawAttributes):
+        value = (doubleQuotedValue or singleQuotedValue).decode("utf-8")
+        if "&" in value:
+            value = unescapeXML(value)
+        attrs[name.decode("ascii")] = value
+    return attrs
 
 
 def fetchUnicodesAndAnchors(glif):
     """
     Get a list of unicodes listed in glif.
     """
-    parser = FetchUnicodesAndAnchorsParser()
-    parser.parse(glif)
-    return parser.unicodes, parser.anchors
+    scanner = ExpatGlifScanner()
+    scanner.parse(glif)
+    return scanner.unicodes, scanner.anchors
 
 
 def _parseNumber(s):
     if not s:
         return None
+    if s.lstrip("-").isdecimal():
+        # Most coordinates are integers, no need to go through float()
+        return int(s)
     f = float(s)
     i = int(f)
     if i == f:
@@ -153,15 +417,22 @@ def _parseAnchorAttrs(attrs):
     return attrs.get("name"), _parseNumber(attrs.get("x")), _parseNumber(attrs.get("y"))
 
 
-class FetchUnicodesAndAnchorsParser(BaseGlifParser):
+class ExpatGlifScanner:
 
     def __init__(self):
         self.unicodes = []
         self.anchors = []
-        super().__init__()
+        self._depth = 0
+        self._parser = ParserCreate()
+        self._parser.StartElementHandler = self._startElementHandler
+        self._parser.EndElementHandler = self._endElementHandler
+
+    def parse(self, glif):
+        self._parser.Parse(glif, True)
 
-    def startElementHandler(self, name, attrs):
-        if self._elementStack and self._elementStack[-1] == "glyph":
+    def _startElementHandler(self, name, attrs):
+        if self._depth == 1:
+            # We're a direct child of the <glyph> element
             if name == "unicode":
                 value = attrs.get("hex")
                 if value is not None:
@@ -173,7 +444,10 @@ class FetchUnicodesAndAnchorsParser(BaseGlifParser):
                         pass
             elif name == "anchor":
                 self.anchors.append(_parseAnchorAttrs(attrs))
-        super().startElementHandler(name, attrs)
+        self._depth += 1
+
+    def _endElementHandler(self, name):
+        self._depth -= 1
 
 
 class MinimalFontObject:
@@ -184,11 +458,16 @@ class MinimalFontObject:
     # unicodes and anchors, and at the font level, only features, groups,
     # kerning and lib are needed.
 
-    def __init__(self, ufoPath, reader, revCmap, anchors):
+    __slots__ = ("path", "_revCmap", "_anchors", "_glyphNames", "features", "groups",
+                 "kerning", "lib", "info", "_glyphs")
+
+    def __init__(self, ufoPath, reader, revCmap, anchors, glyphSet=None):
         self.path = ufoPath
         self._revCmap = revCmap
         self._anchors = anchors
-        self._glyphNames = set(reader.getGlyphSet().contents.keys())
+        if glyphSet is None:
+            glyphSet = reader.getGlyphSet()
+        self._glyphNames = set(glyphSet.contents.keys())
         self._glyphNames.add(".notdef")  # ensure we have .notdef
         self.features = MinimalFeaturesObject(reader.readFeatures())
         self.groups = reader.readGroups()
@@ -196,43 +475,58 @@ class MinimalFontObject:
         self.lib = reader.readLib()
         self.info = SimpleNamespace()
         reader.readInfo(self.info)
-        self._glyphs = {}
+        # Only glyphs with unicodes or anchors carry any information, build
+        # those up front. The others are created on demand.
+        self._glyphs = {glyphName: self._newGlyph(glyphName)
+                        for glyphName in revCmap.keys() | anchors.keys()
+                        if glyphName in self._glyphNames}
 
     def keys(self):
         return self._glyphNames
 
     def __getitem__(self, glyphName):
-        if glyphName not in self._glyphNames:
-            raise KeyError(glyphName)
-        # TODO: should we even bother caching?
         glyph = self._glyphs.get(glyphName)
         if glyph is None:
-            glyph = MinimalGlyphObject(glyphName, self._revCmap.get(glyphName), self._anchors.get(glyphName, ()))
-            self._glyphs[glyphName] = glyphName
+            if glyphName not in self._glyphNames:
+                raise KeyError(glyphName)
+            glyph = self._newGlyph(glyphName)
+            self._glyphs[glyphName] = glyph
         return glyph
 
+    def _newGlyph(self, glyphName):
+        return MinimalGlyphObject(glyphName, self._revCmap.get(glyphName), self._anchors.get(glyphName, ()))
+
 
 class MinimalGlyphObject:
 
+    __slots__ = ("name", "unicodes", "_anchorTuples", "_anchors")
+
     def __init__(self, name, unicodes, anchors):
         self.name = name
         self.unicodes = unicodes
-        self.anchors = [MinimalAnchorObject(name, x, y) for name, x, y in anchors]
+        self._anchorTuples = anchors
+        self._anchors = None
 
     @property
     def unicode(self):
         return self.unicodes[0] if self.unicodes else None
 
+    @property
+    def anchors(self):
+        # The feature writers only look at the anchors of some glyphs, so
+        # we only create the anchor objects when asked.
+        if self._anchors is None:
+            self._anchors = [MinimalAnchorObject._make(anchor) for anchor in self._anchorTuples]
+        return self._anchors
 
-class MinimalAnchorObject:
 
-    def __init__(self, name, x, y):
-        self.name = name
-        self.x = x
-        self.y = y
+# The feature writers only read the name, x and y attributes of anchors
+MinimalAnchorObject = namedtuple("MinimalAnchorObject", ["name", "x", "y"])
 
 
 class MinimalFeaturesObject:
 
+    __slots__ = ("text",)
+
     def __init__(self, featureText):
         self.text = featureText
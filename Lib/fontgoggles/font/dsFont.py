@@ -20,6 +20,7 @@ from .glyphDrawing import EmptyDrawing, GlyphDrawing
 from .ufoFont import Glyph, NotDefGlyph, UFOState, extractIncludedFeatureFiles
 from ..compile.compilerPool import compileUFOToPath, compileDSToBytes, CompilerError
 from ..compile.dsCompiler import getTTPaths
+from ..compile.ufoCompiler import getUnicodesAndAnchors
 from ..misc.hbShape import HBShape
 from ..misc.properties import cachedProperty
 from ..mac.makePathFromOutline import makePathFromArrays
@@ -305,11 +306,7 @@ class DSFont(BaseFont):
     def _getUnicodesAndAnchors(self, sourcePath):
         f = io.BytesIO(self._sourceFontData[sourcePath])
         ttFont = TTFont(f, lazy=True)
-        unicodes = defaultdict(list)
-        for code, gn in ttFont.getBestCmap().items():
-            unicodes[gn].append(code)
-        anchors = pickle.loads(ttFont["FGAx"].data)
-        return unicodes, anchors
+        return getUnicodesAndAnchors(ttFont)
 
 
 # From FreeType:
@@ -1,7 +1,5 @@
-from collections import defaultdict
 import io
 import pathlib
-import pickle
 import os
 import re
 import sys
@@ -20,7 +18,7 @@ from ufo2ft.constants import COLOR_LAYER_MAPPING_KEY, COLOR_PALETTES_KEY
 from .baseFont import BaseFont
 from .glyphDrawing import GlyphDrawing, GlyphLayersDrawing
 from ..compile.compilerPool import compileUFOToBytes
-from ..compile.ufoCompiler import fetchCharacterMappingAndAnchors
+from ..compile.ufoCompiler import fetchCharacterMappingAndAnchors, getUnicodesAndAnchors
 from ..misc.hbShape import HBShape
 from ..misc.properties import cachedProperty
 
@@ -112,11 +110,7 @@ class UFOFont(BaseFont):
         return True
 
     def _getUnicodesAndAnchors(self):
-        unicodes = defaultdict(list)
-        for code, gn in self.ttFont.getBestCmap().items():
-            unicodes[gn].append(code)
-        anchors = pickle.loads(self.ttFont["FGAx"].data)
-        return unicodes, anchors
+        return getUnicodesAndAnchors(self.ttFont)
 
     def _getShaper(self, fontData):
         return HBShape(fontData,
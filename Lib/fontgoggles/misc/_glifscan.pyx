@@ -0,0 +1,143 @@
+# cython: language_level=3
+"""Fast byte scanner to extract <unicode> and <anchor> elements from GLIF data.
+
+This is an optional accelerator for fontgoggles.compile.ufoCompiler: if this
+extension is not built, the regex-based scanner is used instead.
+"""
+
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_GET_SIZE
+from cpython.unicode cimport PyUnicode_DecodeUTF8
+from libc.string cimport memchr, memcmp
+
+
+cdef inline bint _isSpace(unsigned char c):
+    return c == c' ' or c == c'\t' or c == c'\n' or c == c'\r'
+
+
+cdef inline bint _isNameChar(unsigned char c):
+    return (c'a' <= c <= c'z') or (c'A' <= c <= c'Z') or (c'0' <= c <= c'9') or c == c'_'
+
+
+cdef inline bint _isTagEnd(unsigned char c):
+    return _isSpace(c) or c == c'/' or c == c'>'
+
+
+cdef bint _parseHex(const unsigned char *p, const unsigned char *end, long *result):
+    # Parse the common case of a short, plain hex number without creating
+    # Python objects. Return False if the value needs to go through int().
+    # Code points have at most 6 hex digits, so the value fits in a 32-bit
+    # long, even on platforms where long is 32 bits.
+    cdef long value = 0
+    cdef unsigned char c
+    if p == end or end - p > 6:
+        return False
+    while p < end:
+        c = p[0]
+        if c'0' <= c <= c'9':
+            value = (value << 4) | (c - c'0')
+        elif c'a' <= c <= c'f':
+            value = (value << 4) | (c - c'a' + 10)
+        elif c'A' <= c <= c'F':
+            value = (value << 4) | (c - c'A' + 10)
+        else:
+            return False
+        p += 1
+    result[0] = value
+    return True
+
+
+def scan(bytes data not None):
+    """Return a list of unicodes and a list of (anchorName, x, y) tuples, where
+    x and y are the raw attribute strings (or None). Return None if the data
+    contains something the scanner doesn't handle (XML entities or single
+    quotes in attribute values), in which case the caller should fall back to
+    a slower method.
+    """
+    cdef const unsigned char *start = <const unsigned char *>PyBytes_AS_STRING(data)
+    cdef const unsigned char *end = start + PyBytes_GET_SIZE(data)
+    cdef const unsigned char *p = start
+    cdef const unsigned char *tagEnd
+    cdef const unsigned char *nameStart
+    cdef const unsigned char *valueStart
+    cdef const unsigned char *valueEnd
+    cdef const unsigned char *hexStart
+    cdef const unsigned char *hexEnd
+    cdef Py_ssize_t nameLength
+    cdef bint isUnicode
+    cdef long codePoint
+    unicodes = []
+    anchors = []
+
+    while p < end:
+        p = <const unsigned char *>memchr(p, c'<', end - p)
+        if p == NULL:
+            break
+        p += 1
+        while p < end and _isSpace(p[0]):
+            p += 1
+        if end - p > 7 and memcmp(p, b"unicode", 7) == 0 and _isTagEnd(p[7]):
+            isUnicode = True
+            p += 7
+        elif end - p > 6 and memcmp(p, b"anchor", 6) == 0 and _isTagEnd(p[6]):
+            isUnicode = False
+            p += 6
+        else:
+            continue
+        tagEnd = <const unsigned char *>memchr(p, c'>', end - p)
+        if tagEnd == NULL:
+            break
+
+        hexStart = hexEnd = NULL
+        name = x = y = None
+        while p < tagEnd:
+            if not _isNameChar(p[0]):
+                p += 1
+                continue
+            nameStart = p
+            while p < tagEnd and _isNameChar(p[0]):
+                p += 1
+            nameLength = p - nameStart
+            while p < tagEnd and _isSpace(p[0]):
+                p += 1
+            if p >= tagEnd or p[0] != c'=':
+                continue
+            p += 1
+            while p < tagEnd and _isSpace(p[0]):
+                p += 1
+            if p < tagEnd and p[0] == c"'":
+                # Single-quoted values are rare, leave them to the caller
+                return None
+            if p >= tagEnd or p[0] != c'"':
+                continue
+            valueStart = p + 1
+            valueEnd = <const unsigned char *>memchr(valueStart, c'"', tagEnd - valueStart)
+            if valueEnd == NULL:
+                break
+            p = valueEnd + 1
+            if memchr(valueStart, c'&', valueEnd - valueStart) != NULL:
+                return None
+            if isUnicode:
+                if nameLength == 3 and memcmp(nameStart, b"hex", 3) == 0:
+                    hexStart = valueStart
+                    hexEnd = valueEnd
+            elif nameLength == 4 and memcmp(nameStart, b"name", 4) == 0:
+                name = PyUnicode_DecodeUTF8(<const char *>valueStart, valueEnd - valueStart, NULL)
+            elif nameLength == 1 and nameStart[0] == c'x':
+                x = PyUnicode_DecodeUTF8(<const char *>valueStart, valueEnd - valueStart, NULL)
+            elif nameLength == 1 and nameStart[0] == c'y':
+                y = PyUnicode_DecodeUTF8(<const char *>valueStart, valueEnd - valueStart, NULL)
+        p = tagEnd + 1
+
+        if isUnicode:
+            if hexStart != NULL:
+                if _parseHex(hexStart, hexEnd, &codePoint):
+                    unicodes.append(codePoint)
+                else:
+                    try:
+                        unicodes.append(int((<const char *>hexStart)[:hexEnd - hexStart], 16))
+                    except ValueError:
+                        pass
+        else:
+            anchors.append((name, x, y))
+
+    return unicodes, anchors
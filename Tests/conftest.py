@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def fontCacheDir(tmp_path, monkeypatch):
+    # Don't read from or write to the user's compiled font cache
+    monkeypatch.setenv("FONTGOGGLES_CACHE_DIR", str(tmp_path / "fontgoggles-cache"))
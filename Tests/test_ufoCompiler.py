@@ -1,6 +1,7 @@
 import asyncio
 import os
 import pytest
+import shutil
 from fontTools.ufoLib import UFOReader
 from fontgoggles.compile.ufoCompiler import fetchCharacterMappingAndAnchors
 from fontgoggles.compile.compilerPool import compileUFOToPath
@@ -34,6 +35,98 @@ def test_ufoCharacterMapping_glyphNames():
     assert anchors == {"A": [("top", 645, 815)]}
 
 
+def test_minimalFontObjectGlyphCache():
+    from fontgoggles.compile.ufoCompiler import MinimalFontObject, MinimalGlyphObject
+    ufoPath = getFontPath("MutatorSansBoldCondensed.ufo")
+    reader = UFOReader(ufoPath)
+    cmap, revCmap, anchors = fetchCharacterMappingAndAnchors(reader.getGlyphSet(), ufoPath)
+    ufo = MinimalFontObject(ufoPath, reader, revCmap, anchors)
+    assert "I.narrow" not in revCmap
+    for glyphName in ["A", "I.narrow"]:
+        glyph = ufo[glyphName]
+        assert isinstance(glyph, MinimalGlyphObject)
+        assert ufo[glyphName] is glyph
+        assert ufo._glyphs[glyphName] is glyph
+    assert ufo["A"].unicodes == [0x0041]
+    assert ufo["I.narrow"].unicode is None
+    with pytest.raises(KeyError):
+        ufo["nonexistent"]
+
+
+def test_compileUFOToPath_cache(tmpdir, monkeypatch):
+    from fontgoggles.compile import ufoCompiler
+    cacheDir = tmpdir / "cache"
+    monkeypatch.setenv(ufoCompiler.CACHE_DIR_ENV_VAR, str(cacheDir))
+    ufoPath = getFontPath("MutatorSansBoldCondensed.ufo")
+    ttPath1 = tmpdir / "test1.ttf"
+    ttPath2 = tmpdir / "test2.ttf"
+    ufoCompiler.compileUFOToPath(ufoPath, str(ttPath1))
+    assert len(cacheDir.listdir()) == 1
+    ufoCompiler.compileUFOToPath(ufoPath, str(ttPath2))
+    assert len(cacheDir.listdir()) == 1
+    assert ttPath1.read_binary() == ttPath2.read_binary()
+
+
+def test_compileUFOToPath_cacheDisabled(tmpdir, monkeypatch):
+    from fontgoggles.compile import ufoCompiler
+    monkeypatch.setenv(ufoCompiler.CACHE_DIR_ENV_VAR, "")
+    ufoPath = getFontPath("MutatorSansBoldCondensed.ufo")
+    reader = ufoCompiler.UFOReader(ufoPath, validate=False)
+    assert ufoCompiler._getCachePath(reader, reader.getGlyphSet()) is None
+
+
+def test_compileUFOToPath_cacheCodeFingerprint(monkeypatch):
+    from fontgoggles.compile import ufoCompiler
+    ufoPath = getFontPath("MutatorSansBoldCondensed.ufo")
+    reader = ufoCompiler.UFOReader(ufoPath, validate=False)
+    cachePath1 = ufoCompiler._getCachePath(reader, reader.getGlyphSet())
+    # Pretend the compiler code was edited
+    monkeypatch.setattr(ufoCompiler, "_codeFingerprint", b"edited")
+    cachePath2 = ufoCompiler._getCachePath(reader, reader.getGlyphSet())
+    assert cachePath1 != cachePath2
+
+
+def test_compileUFOToPath_cachePruning(tmpdir, monkeypatch):
+    from fontgoggles.compile import ufoCompiler
+    cacheDir = tmpdir / "cache"
+    cacheDir.mkdir()
+    monkeypatch.setattr(ufoCompiler, "_maxCacheFiles", 2)
+    ttPath = tmpdir / "test.ttf"
+    ttPath.write_binary(b"test")
+    for i in range(4):
+        ufoCompiler._writeCache(str(ttPath), str(cacheDir / f"{i}.ttf"))
+        os.utime(cacheDir / f"{i}.ttf", (i, i))
+    assert sorted(p.basename for p in cacheDir.listdir()) == ["2.ttf", "3.ttf"]
+
+
+def test_compileUFOToPath_cachePruningSize(tmpdir, monkeypatch):
+    from fontgoggles.compile import ufoCompiler
+    cacheDir = tmpdir / "cache"
+    cacheDir.mkdir()
+    monkeypatch.setattr(ufoCompiler, "_maxCacheSize", 25)
+    ttPath = tmpdir / "test.ttf"
+    ttPath.write_binary(b"0123456789")
+    for i in range(4):
+        ufoCompiler._writeCache(str(ttPath), str(cacheDir / f"{i}.ttf"))
+        os.utime(cacheDir / f"{i}.ttf", (i, i))
+    assert sorted(p.basename for p in cacheDir.listdir()) == ["2.ttf", "3.ttf"]
+
+
+def test_compileUFOToPath_cacheDuplicateUnicodes(tmpdir, monkeypatch, caplog):
+    from fontgoggles.compile import ufoCompiler
+    monkeypatch.setenv(ufoCompiler.CACHE_DIR_ENV_VAR, str(tmpdir / "cache"))
+    ufoPath = tmpdir / "test.ufo"
+    shutil.copytree(getFontPath("MutatorSansBoldCondensed.ufo"), ufoPath)
+    # Give "B" the code point of "A"
+    glifPath = ufoPath / "glyphs" / "B_.glif"
+    glifPath.write_binary(glifPath.read_binary().replace(b'hex="0042"', b'hex="0041"'))
+    for i in range(2):
+        caplog.clear()
+        ufoCompiler.compileUFOToPath(str(ufoPath), str(tmpdir / f"test{i}.ttf"))
+        assert "U+0041:A,B" in caplog.text
+    assert len((tmpdir / "cache").listdir()) == 1
+
+
 @pytest.mark.asyncio
 async def test_compileUFOToPath(tmpdir):
     ufoPath = getFontPath("MutatorSansBoldWideMutated.ufo")
@@ -66,3 +159,75 @@ async def test_compileUFOToPathMultiple(tmpdir):
     results = await asyncio.gather(*coros)
     assert results == [None] * len(results)
     assert [(os.stat(p).st_size > 0) for p in ttPaths] == [True] * len(results)
+
+
+def test_glifScanner():
+    from fontgoggles.compile import ufoCompiler
+    if ufoCompiler._glifscan is None:
+        pytest.skip("_glifscan extension is not built")
+    glyphSet = UFOReader(getFontPath("MutatorSansBoldWideMutated.ufo")).getGlyphSet()
+    for glyphName in glyphSet.keys():
+        data = glyphSet.getGLIF(glyphName)
+        if b"<!--" in data:
+            continue  # the scanner does not handle comments
+        unicodes, rawAnchors = ufoCompiler._glifscan.scan(data)
+        anchors = [(name, ufoCompiler._parseNumber(x), ufoCompiler._parseNumber(y)) for name, x, y in rawAnchors]
+        expectedUnicodes, expectedAnchors = ufoCompiler.fetchUnicodesAndAnchors(data)
+        assert unicodes == expectedUnicodes
+        assert anchors == expectedAnchors
+    with pytest.raises(TypeError):
+        ufoCompiler._glifscan.scan(None)
+
+
+def test_scanGlifComments():
+    from fontgoggles.compile.ufoCompiler import _scanGlif
+    glif = b"""<?xml version="1.0" encoding="UTF-8"?>
+<!-- a harmless comment -->
+<glyph name="A" format="2">
+  <unicode hex="0041"/>
+  <anchor x="10" y="20" name="top"/>
+</glyph>
+"""
+    assert _scanGlif(glif) == ([0x41], [("top", 10, 20)])
+    glif = glif.replace(b"<!-- a harmless comment -->",
+                        b'<!-- <unicode hex="1234"/> <anchor x="0" y="0" name="bottom"/> -->')
+    assert _scanGlif(glif) == ([0x41], [("top", 10, 20)])
+
+
+def test_getUnicodesAndAnchors():
+    from fontgoggles.compile.ufoCompiler import compileUFOToFont, getUnicodesAndAnchors
+    ufoPath = getFontPath("MutatorSansBoldWideMutated.ufo")
+    reader = UFOReader(ufoPath)
+    _, revCmap, anchors = fetchCharacterMappingAndAnchors(reader.getGlyphSet(), ufoPath)
+    ttFont, error = compileUFOToFont(ufoPath)
+    assert getUnicodesAndAnchors(ttFont) == (revCmap, anchors)
+
+
+@pytest.mark.parametrize("useGlifScanner", [False, True])
+def test_scanGlifAttributeQuotesAndCharRefs(useGlifScanner, monkeypatch):
+    from fontgoggles.compile import ufoCompiler
+    if not useGlifScanner:
+        monkeypatch.setattr(ufoCompiler, "_glifscan", None)
+    elif ufoCompiler._glifscan is None:
+        pytest.skip("_glifscan extension is not built")
+    glif = b"""<glyph name="A" format="2">
+  <unicode hex='0041'/>
+  <anchor name='top' x='1' y="2"/>
+</glyph>
+"""
+    assert ufoCompiler._scanGlif(glif) == ([0x41], [("top", 1, 2)])
+    glif = b"""<glyph name="A" format="2">
+  <unicode hex="0041"/>
+  <anchor name="t&#233;&#xE9;&amp;" x="1" y="2"/>
+</glyph>
+"""
+    assert ufoCompiler._scanGlif(glif) == ([0x41], [("téé&", 1, 2)])
+    ufo2Glif = b"""<glyph name="A" format="1">
+  <outline>
+    <contour>
+      <point x='1' y='2' type='move' name='t&#233;'/>
+    </contour>
+  </outline>
+</glyph>
+"""
+    assert ufoCompiler._scanGlif(ufo2Glif, ufo2=True) == ([], [("té", 1, 2)])
@@ -4,6 +4,12 @@ import re
 from setuptools import setup, find_packages
 import subprocess
 
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    # The GLIF scanner extension is optional, there is a pure Python fallback
+    cythonize = None
+
 
 class build(_build):
     def run(self):
@@ -19,6 +25,12 @@ with open('Lib/fontgoggles/__init__.py', "r") as fg_init:
     fg_version = match.group(1)
 
 
+if cythonize is not None:
+    extModules = cythonize(["Lib/fontgoggles/misc/_glifscan.pyx"])
+else:
+    extModules = []
+
+
 setup(
     name="fontgoggles",
     use_scm_version={"write_to": "Lib/fontgoggles/_version.py"},
@@ -30,6 +42,7 @@ setup(
     package_dir={"": "Lib"},
     packages=find_packages("Lib"),
     package_data={'fontgoggles.mac': ['*.dylib']},
+    ext_modules=extModules,
     install_requires=[
     ],
     extras_require={